@@ -1,9 +1,446 @@
+import functools
 import json
 import subprocess
 import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from pathlib import Path
 
+import pytest
 
+import vix_alert
+
+
+def test_main_outputs_json(monkeypatch, capsys):
+    monkeypatch.delenv("GITHUB_OUTPUT", raising=False)
+    monkeypatch.setattr(vix_alert, "fetch_vix", lambda: (12.3, "mock"))
+    assert vix_alert.main() == 0
+    data = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+    for key in ("timestamp", "vix", "threshold", "exceeded"):
+        assert key in data, f"Missing key {key} in payload {data}"
+    assert data["vix"] == 12.3
+    assert data["source"] == "mock"
+    assert data["exceeded"] is False
+    assert isinstance(data["threshold"], (int, float)) and data["threshold"] == 35.0
+
+
+def test_main_writes_github_outputs(tmp_path, monkeypatch, capsys):
+    output = tmp_path / "github_output"
+    output.write_text("earlier=1\n", encoding="utf-8")
+    monkeypatch.setenv("GITHUB_OUTPUT", str(output))
+    monkeypatch.setattr(vix_alert, "fetch_vix", lambda: (36.2, "mock"))
+    assert vix_alert.main() == 0
+    stdout_line = capsys.readouterr().out.strip().splitlines()[-1]
+    assert output.read_text(encoding="utf-8") == (
+        "earlier=1\n"
+        "vix_value=36.2\n"
+        "vix_exceeded=true\n"
+        "vix_source=mock\n"
+        "vix_payload<<EOF\n"
+        f"{stdout_line}\n"
+        "EOF\n"
+    )
+    assert json.loads(stdout_line)["exceeded"] is True
+
+
+@pytest.mark.parametrize("dumps", [
+    vix_alert._dumps,
+    lambda obj: json.dumps(obj, separators=(",", ":")),  # stdlib fallback
+])
+def test_main_error_path(dumps, monkeypatch, capsys):
+    def boom():
+        raise RuntimeError("All VIX data sources failed")
+
+    monkeypatch.delenv("GITHUB_OUTPUT", raising=False)
+    monkeypatch.setattr(vix_alert, "fetch_vix", boom)
+    monkeypatch.setattr(vix_alert, "_dumps", dumps)
+    assert vix_alert.main() == 2
+    out = capsys.readouterr().out.strip().splitlines()[-1]
+    assert '"vix":null' in out
+    data = json.loads(out)
+    assert data["error"] == "All VIX data sources failed"
+    assert data["source"] == "error"
+    assert data["exceeded"] is False
+
+
+def test_build_payload_exceeded():
+    payload = vix_alert.build_payload(40.0, "test")
+    assert payload["exceeded"] is True
+    assert list(payload) == ["timestamp", "vix", "threshold", "exceeded", "source"]
+
+
+@pytest.mark.parametrize("attempt", [1, 2, 3, 7, 20])
+def test_backoff_delay_within_jitter_bounds(attempt, monkeypatch):
+    cap = min(30.0, 0.5 * 2 ** (attempt - 1))
+    for draw in (0.0, 0.5, 0.999999):
+        monkeypatch.setattr(vix_alert.random, "random", lambda: draw)
+        assert 0.5 * cap <= vix_alert._backoff_delay(attempt) <= cap
+
+
+def test_race_stops_slow_loser():
+    gate = threading.Event()
+    loser_calls = []
+
+    def loser(deadline):
+        loser_calls.append(1)
+        gate.wait(5)
+        return None
+
+    providers = (("loser", loser), ("winner", lambda deadline: (18.5, "winner")))
+    start = time.monotonic()
+    assert vix_alert._race(providers, time.monotonic() + 20) == (18.5, "winner")
+    assert time.monotonic() - start < 1
+    gate.set()
+    time.sleep(0.1)
+    assert loser_calls == [1]  # stop event prevents further attempts
+
+
+def test_race_uses_daemon_workers_and_sets_stop(monkeypatch):
+    calls = []
+    real_retry = vix_alert._retry
+
+    def recording_retry(fetch_fn, name, deadline, stop=None):
+        calls.append((threading.current_thread(), stop))
+        return real_retry(fetch_fn, name, deadline, stop)
+
+    monkeypatch.setattr(vix_alert, "_retry", recording_retry)
+    providers = (("winner", lambda deadline: (18.5, "winner")),)
+    assert vix_alert._race(providers, time.monotonic() + 20) == (18.5, "winner")
+    assert len(calls) == 1
+    assert all(worker.daemon for worker, _ in calls)  # never joined at interpreter exit
+    assert all(stop is not None and stop.is_set() for _, stop in calls)
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    path = tmp_path / "cache.json"
+    monkeypatch.setattr(vix_alert, "_CACHE_PATH", path)
+    monkeypatch.setattr(vix_alert, "CACHE_TTL_SECONDS", 55.0)
+    return path
+
+
+def test_cache_roundtrip_marks_source(cache_file):
+    vix_alert._write_cache(21.5, "cboe")
+    assert vix_alert._read_cache() == (21.5, "cached:cboe")
+    assert list(cache_file.parent.iterdir()) == [cache_file]  # no stray tempfiles
+
+
+def test_cache_expires_after_ttl(cache_file, monkeypatch):
+    vix_alert._write_cache(21.5, "cboe")
+    now = time.time()
+    monkeypatch.setattr(vix_alert.time, "time", lambda: now + 56)
+    assert vix_alert._read_cache() is None
+
+
+def test_cache_skips_nan(cache_file):
+    vix_alert._write_cache(float("nan"), "error")
+    assert not cache_file.exists()
+
+
+@pytest.mark.parametrize("content", [
+    None,
+    "",
+    "not json",
+    '{"vix": 1.0}',
+    '{"vix": "x", "source": "a", "ts": 0}',
+    '{"vix": 12.0, "source": "cboe", "ts": FUTURE}',
+])
+def test_cache_ignores_missing_or_corrupt_file(cache_file, content):
+    if content is not None:
+        content = content.replace("FUTURE", repr(time.time() + 1e7))
+        cache_file.write_text(content, encoding="utf-8")
+    assert vix_alert._read_cache() is None
+
+
+def test_cache_disabled_with_zero_ttl(cache_file, monkeypatch):
+    vix_alert._write_cache(21.5, "cboe")
+    monkeypatch.setattr(vix_alert, "CACHE_TTL_SECONDS", 0.0)
+    assert vix_alert._read_cache() is None
+    cache_file.unlink()
+    vix_alert._write_cache(21.5, "cboe")
+    assert not cache_file.exists()
+
+
+class _FakeResponse:
+    def __init__(self, payload, status_code=200, headers=None):
+        self.content = json.dumps(payload).encode()
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class _FakeSession:
+    def __init__(self, response):
+        self.response = response
+
+    def get(self, url, timeout=None):
+        return self.response
+
+
+def _chart(closes):
+    return {"chart": {"result": [{"indicators": {"quote": [{"close": closes}]}}]}}
+
+
+@pytest.mark.parametrize("payload, expected", [
+    (_chart([17.1, 17.456, None, None]), (17.46, "yahoo-chart")),
+    (_chart([None, None]), None),
+    ({"chart": {"result": []}}, None),
+    ({"chart": {"result": None, "error": {"code": "Not Found"}}}, None),
+])
+def test_yahoo_chart_parses_last_close(payload, expected, monkeypatch):
+    monkeypatch.setattr(vix_alert, "_get_session", lambda: _FakeSession(_FakeResponse(payload)))
+    assert vix_alert._yahoo_chart(time.monotonic() + 20) == expected
+
+
+def test_log_handler_writes_once_on_flush(monkeypatch):
+    writes = []
+
+    class _Stderr:
+        def write(self, text):
+            writes.append(text)
+
+        def flush(self):
+            pass
+
+    monkeypatch.setattr(sys, "stderr", _Stderr())
+    handler = vix_alert._BatchedStderrHandler()
+    handler.setFormatter(vix_alert.logging.Formatter("%(message)s"))
+    for msg in ("a", "b", "c"):
+        handler.handle(vix_alert.logging.makeLogRecord({"msg": msg, "levelno": vix_alert.logging.INFO}))
+    assert writes == []
+    handler.flush()
+    assert writes == ["a\nb\nc\n"]
+    handler.handle(vix_alert.logging.makeLogRecord({"msg": "d", "levelno": vix_alert.logging.WARNING}))
+    handler.handle(vix_alert.logging.makeLogRecord({"msg": "boom", "levelno": vix_alert.logging.ERROR}))
+    assert writes == ["a\nb\nc\n", "d\nboom\n"]  # errors flush immediately
+
+
+def test_parse_retry_after():
+    assert vix_alert._parse_retry_after("7") == 7.0
+    assert vix_alert._parse_retry_after("-3") == 0.0
+    future = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= vix_alert._parse_retry_after(future) <= 30
+    past = format_datetime(datetime.now(timezone.utc) - timedelta(hours=1), usegmt=True)
+    assert vix_alert._parse_retry_after(past) == 0.0
+    for value in (None, "", "soon", "Mon, 99 Foo"):
+        assert vix_alert._parse_retry_after(value) is None
+
+
+@pytest.mark.parametrize("status", [400, 401, 403, 404, 410])
+def test_check_status_unrecoverable(status):
+    with pytest.raises(vix_alert._Unrecoverable):
+        vix_alert._check_status(status)
+
+
+def test_check_status_rate_limited():
+    with pytest.raises(vix_alert._RateLimited) as excinfo:
+        vix_alert._check_status(429, "4")
+    assert excinfo.value.retry_after == 4.0
+
+
+@pytest.mark.parametrize("status", [500, 502, 503])
+def test_check_status_server_error_is_retryable(status):
+    with pytest.raises(RuntimeError) as excinfo:
+        vix_alert._check_status(status)
+    assert not isinstance(excinfo.value, (vix_alert._Unrecoverable, vix_alert._RateLimited))
+    vix_alert._check_status(200)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(vix_alert.time, "sleep", recorded.append)
+    return recorded
+
+
+def _failing(exc, calls):
+    def fetch(*_):
+        calls.append(1)
+        raise exc
+    return fetch
+
+
+def test_retry_gives_up_immediately_on_unrecoverable(sleeps):
+    calls = []
+    fetch = _failing(vix_alert._Unrecoverable("HTTP 404"), calls)
+    assert vix_alert._retry(fetch, "dead", time.monotonic() + 60) is None
+    assert calls == [1]
+    assert sleeps == []
+
+
+def test_retry_sleeps_for_retry_after(sleeps):
+    calls = []
+    fetch = _failing(vix_alert._RateLimited(4.0), calls)
+    assert vix_alert._retry(fetch, "limited", time.monotonic() + 60) is None
+    assert len(calls) == vix_alert.MAX_RETRIES
+    assert sleeps == [4.0] * (vix_alert.MAX_RETRIES - 1)
+
+
+def test_retry_caps_retry_after(sleeps):
+    fetch = _failing(vix_alert._RateLimited(3600.0), [])
+    vix_alert._retry(fetch, "limited", time.monotonic() + 600)
+    assert sleeps and all(delay == vix_alert.RETRY_MAX_SECONDS for delay in sleeps)
+
+
+def test_retry_backs_off_on_transient_error(sleeps):
+    calls = []
+    fetch = _failing(RuntimeError("HTTP 503"), calls)
+    assert vix_alert._retry(fetch, "flaky", time.monotonic() + 60) is None
+    assert len(calls) == vix_alert.MAX_RETRIES
+    assert len(sleeps) == vix_alert.MAX_RETRIES - 1
+    assert all(delay <= vix_alert.RETRY_MAX_SECONDS for delay in sleeps)
+
+
+class _FakeSocket:
+    def __init__(self):
+        self.timeout = None
+
+    def settimeout(self, value):
+        self.timeout = value
+
+
+class _FakeHTTPResponse:
+    def __init__(self, status, body):
+        self.status = status
+        self._body = body
+
+    def read(self):
+        return self._body
+
+    def getheader(self, name):
+        return None
+
+
+class _FakeHTTPSConnection:
+    instances = []
+    fail_next = False
+
+    def __init__(self, host, timeout=None):
+        self.host = host
+        self.timeout = timeout
+        self.sock = None
+        self.requests = 0
+        self.closed = False
+        _FakeHTTPSConnection.instances.append(self)
+
+    def connect(self):
+        self.sock = _FakeSocket()
+
+    def request(self, method, path, headers=None):
+        if _FakeHTTPSConnection.fail_next:
+            _FakeHTTPSConnection.fail_next = False
+            raise ConnectionResetError("reset by peer")
+        self.requests += 1
+
+    def getresponse(self):
+        return _FakeHTTPResponse(200, json.dumps({"data": [{"lastSale": 19.876}]}).encode())
+
+    def close(self):
+        self.closed = True
+        self.sock = None
+
+
+@pytest.fixture
+def fake_cboe(monkeypatch):
+    _FakeHTTPSConnection.instances = []
+    _FakeHTTPSConnection.fail_next = False
+    monkeypatch.setattr(vix_alert.http.client, "HTTPSConnection", _FakeHTTPSConnection)
+    vix_alert._drop_cboe_connection()
+    yield _FakeHTTPSConnection
+    vix_alert._drop_cboe_connection()
+
+
+def test_cboe_reuses_connection(fake_cboe):
+    assert vix_alert._cboe_api(time.monotonic() + 20) == (19.88, "cboe")
+    assert vix_alert._cboe_api(time.monotonic() + 20) == (19.88, "cboe")
+    (conn,) = fake_cboe.instances
+    assert conn.requests == 2
+    assert conn.timeout == vix_alert.HTTP_TIMEOUT[0]  # connect timeout
+    assert conn.sock.timeout == vix_alert.HTTP_TIMEOUT[1]  # read timeout
+
+
+def test_cboe_reconnects_after_error(fake_cboe):
+    assert vix_alert._cboe_api(time.monotonic() + 20) == (19.88, "cboe")
+    fake_cboe.fail_next = True
+    with pytest.raises(ConnectionResetError):
+        vix_alert._cboe_api(time.monotonic() + 20)
+    assert fake_cboe.instances[0].closed
+    assert vix_alert._cboe_api(time.monotonic() + 20) == (19.88, "cboe")
+    assert len(fake_cboe.instances) == 2
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(vix_alert.time, "monotonic", lambda: clock["now"])
+
+    def sleep(seconds):
+        clock["now"] += seconds
+
+    monkeypatch.setattr(vix_alert.time, "sleep", sleep)
+    return clock
+
+
+def test_retry_stops_at_deadline(fake_clock):
+    timeouts = []
+
+    def slow_failure(deadline):
+        timeouts.append(vix_alert._http_timeout(deadline))
+        fake_clock["now"] += 15  # the request eats most of the budget
+        raise RuntimeError("timed out")
+
+    deadline = fake_clock["now"] + 20
+    assert vix_alert._retry(slow_failure, "slow", deadline) is None
+    assert len(timeouts) == 2  # third attempt skipped: budget exhausted
+    assert timeouts[0] == vix_alert.HTTP_TIMEOUT
+    assert timeouts[1][1] <= 5  # second request clamped to the time left
+    assert fake_clock["now"] >= deadline
+
+
+def test_retry_skips_sleep_crossing_deadline(fake_clock):
+    calls = []
+
+    def failure(deadline):
+        calls.append(fake_clock["now"])
+        raise RuntimeError("HTTP 503")
+
+    start = fake_clock["now"]
+    assert vix_alert._retry(failure, "flaky", start + 0.1) is None
+    assert calls == [start]
+    assert fake_clock["now"] == start  # gave up instead of sleeping
+
+
+def test_fetch_vix_respects_budget(fake_clock, monkeypatch):
+    monkeypatch.setattr(vix_alert, "CACHE_TTL_SECONDS", 0.0)
+    calls = []
+
+    def hog(deadline):
+        calls.append("hog")
+        fake_clock["now"] = deadline
+        return None
+
+    def never(deadline):  # pragma: no cover - must not run
+        calls.append("never")
+        return 1.0, "never"
+
+    monkeypatch.setattr(vix_alert, "_CHAIN", (
+        functools.partial(vix_alert._retry, hog, "hog"),
+        functools.partial(vix_alert._retry, never, "never"),
+    ))
+    with pytest.raises(RuntimeError):
+        vix_alert.fetch_vix()
+    assert calls == ["hog"]
+
+
+def test_race_worker_closes_its_cboe_connection(fake_cboe):
+    providers = (("cboe", vix_alert._cboe_api),)
+    assert vix_alert._race(providers, time.monotonic() + 20) == (19.88, "cboe")
+    (conn,) = fake_cboe.instances
+    assert conn.closed  # closed by the worker before it hands over its result
+
+
+@pytest.mark.slow
 def test_script_runs_and_outputs_json():
     script = Path(__file__).parent / "vix_alert.py"
     proc = subprocess.run([sys.executable, str(script)], capture_output=True, text=True, timeout=60)
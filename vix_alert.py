@@ -10,64 +10,232 @@ Outputs a JSON object to stdout:
 }
 If running inside GitHub Actions, also emits outputs via GITHUB_OUTPUT.
 Robust fetching order:
-1. yfinance intraday (1m)
-2. yfinance daily (5d)
-3. Yahoo Finance quote API
-4. CBOE official index quote API
+1. Yahoo Finance chart API (1m), CBOE official index quote API and Yahoo
+   Finance quote API, raced concurrently (first successful result wins)
+2. CNBC / Investing.com scrapes
+3. yfinance daily (5d) - last resort, since importing yfinance pulls in
+   pandas/numpy; set VIX_ALLOW_YFINANCE=0 to skip it
 Retries applied for transient HTTP errors.
 """
 from __future__ import annotations
+import atexit
+import functools
+import http.client
 import json
 import os
 import sys
 import logging
+import queue
+import random
+import threading
 import time
+import tempfile
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Tuple, Callable
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import math
 
+try:  # optional C-accelerated JSON codec
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(',', ':'))
+
+    _loads = json.loads
+
 THRESHOLD = float(os.getenv("VIX_THRESHOLD", "35"))  # allow override via env
 MAX_RETRIES = 3
-RETRY_SLEEP_SECONDS = 2
+RETRY_BASE_SECONDS = 0.5
+RETRY_MAX_SECONDS = 30.0
+UNRECOVERABLE_STATUS = frozenset({400, 401, 403, 404, 410})
+CACHE_TTL_SECONDS = float(os.getenv("VIX_CACHE_TTL", "55"))  # 0 disables the cache
+_CACHE_PATH = Path(os.getenv("VIX_CACHE", ".vix_cache.json"))
+ALLOW_YFINANCE = os.getenv("VIX_ALLOW_YFINANCE", "1") == "1"
+BUDGET_SECONDS = float(os.getenv("VIX_BUDGET_SECONDS", "20"))  # overall cap for fetch_vix
+
+
+class _BatchedStderrHandler(logging.Handler):
+    """Hold formatted records and write them to stderr in one call on flush().
+
+    StreamHandler flushes after every record; this handler only writes when
+    flush() is called (end of main(), at exit), ``capacity`` records pile up,
+    or a record at ``flush_level`` or above arrives, so errors reach the log
+    even if the process is killed later.
+    """
+
+    def __init__(self, capacity: int = 256, flush_level: int = logging.ERROR) -> None:
+        super().__init__()
+        self.capacity = capacity
+        self.flush_level = flush_level
+        self._lines: List[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._lines.append(self.format(record) + "\n")
+        except Exception:  # pragma: no cover
+            self.handleError(record)
+            return
+        if len(self._lines) >= self.capacity or record.levelno >= self.flush_level:
+            self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            if not self._lines:
+                return
+            blob = "".join(self._lines)
+            self._lines.clear()
+            sys.stderr.write(blob)
+            sys.stderr.flush()
+
 
-logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+_LOG_HANDLER = _BatchedStderrHandler()
+_LOG_HANDLER.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[_LOG_HANDLER])
+atexit.register(_LOG_HANDLER.flush)
 logger = logging.getLogger("vix_alert")
 
-Fetcher = Callable[[], Optional[Tuple[float, str]]]
+# Providers (and chain steps) take the time.monotonic() deadline of the whole fetch.
+Fetcher = Callable[[float], Optional[Tuple[float, str]]]
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+HTTP_TIMEOUT = (3, 10)  # (connect, read) seconds
+RACE_TIMEOUT_SECONDS = 12
+
+_SESSION: Optional["requests.Session"] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> "requests.Session":
+    """Return a shared keep-alive session so retries reuse the TLS connection."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            session.headers.update({
+                'User-Agent': USER_AGENT,
+                'Accept': 'application/json',
+            })
+            session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0))
+            _SESSION = session
+        return _SESSION
+
+
+def _close_connections() -> None:
+    """Close the shared session and the calling thread's CBOE connection.
+
+    Race workers close their own CBOE connection when they finish.
+    """
+    global _SESSION
+    if _SESSION is not None:
+        _SESSION.close()
+        _SESSION = None
+    _drop_cboe_connection()
+
+
+class _Unrecoverable(Exception):
+    """Provider returned a permanent error; retrying will not help."""
+
+
+class _RateLimited(Exception):
+    """Provider returned HTTP 429; ``retry_after`` is the requested wait, if any."""
+
+    def __init__(self, retry_after: Optional[float]) -> None:
+        super().__init__(f"HTTP 429 (Retry-After: {retry_after})")
+        self.retry_after = retry_after
 
 
-def _retry(fetch_fn: Fetcher, name: str) -> Optional[Tuple[float, str]]:
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        from email.utils import parsedate_to_datetime
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def _check_status(status: int, retry_after: Optional[str] = None) -> None:
+    """Raise _Unrecoverable/_RateLimited for special statuses, RuntimeError for other failures."""
+    if status in UNRECOVERABLE_STATUS:
+        raise _Unrecoverable(f"HTTP {status}")
+    if status == 429:
+        raise _RateLimited(_parse_retry_after(retry_after))
+    if status != 200:
+        raise RuntimeError(f"HTTP {status}")
+
+
+def _http_timeout(deadline: float) -> Tuple[float, float]:
+    """HTTP_TIMEOUT clamped so a single request cannot outlive the fetch budget."""
+    left = max(0.01, deadline - time.monotonic())
+    return min(HTTP_TIMEOUT[0], left), min(HTTP_TIMEOUT[1], left)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter, capped at RETRY_MAX_SECONDS."""
+    delay = min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * (2 ** (attempt - 1)))
+    return delay * (0.5 + random.random() * 0.5)
+
+
+def _retry(
+    fetch_fn: Fetcher,
+    name: str,
+    deadline: float,
+    stop: Optional[threading.Event] = None,
+) -> Optional[Tuple[float, str]]:
+    """Call fetch_fn up to MAX_RETRIES times; ``stop`` aborts between attempts."""
+    logger.info("Trying provider: %s", name)
     for attempt in range(1, MAX_RETRIES + 1):
+        if stop is not None and stop.is_set():
+            return None
+        if time.monotonic() >= deadline:
+            logger.warning("%s skipped: fetch budget exhausted", name)
+            return None
+        retry_after: Optional[float] = None
         try:
-            result = fetch_fn()
+            result = fetch_fn(deadline)
             if result is not None:
                 return result
             logger.warning("%s attempt %d returned no data", name, attempt)
-        except Exception as exc:  # pragma: no cover
+        except _Unrecoverable as exc:
+            logger.warning("%s attempt %d unrecoverable (%s); giving up", name, attempt, exc)
+            return None
+        except _RateLimited as exc:
+            logger.warning("%s attempt %d rate limited: %s", name, attempt, exc)
+            retry_after = exc.retry_after
+        except Exception as exc:
             logger.warning("%s attempt %d failed: %s", name, attempt, exc)
         if attempt < MAX_RETRIES:
-            time.sleep(RETRY_SLEEP_SECONDS)
+            if retry_after is not None:
+                delay = min(RETRY_MAX_SECONDS, retry_after)
+            else:
+                delay = _backoff_delay(attempt)
+            if time.monotonic() + delay >= deadline:
+                logger.warning("%s giving up: retry would exceed fetch budget", name)
+                return None
+            if stop is None:
+                time.sleep(delay)
+            elif stop.wait(delay):
+                return None
     return None
 
 
-def _yf_intraday() -> Optional[Tuple[float, str]]:
-    try:
-        import yfinance as yf  # noqa: WPS433
-        data = yf.download("^VIX", period="1d", interval="1m", progress=False)
-        if data is not None and not data.empty:
-            value = float(data["Close"].dropna().iloc[-1])
-            return round(value, 2), "yfinance-intraday"
-    except Exception as exc:  # pragma: no cover
-        logger.debug("yfinance intraday error: %s", exc)
-    return None
-
-
-def _yf_daily() -> Optional[Tuple[float, str]]:
+def _yf_daily(deadline: float) -> Optional[Tuple[float, str]]:
     try:
         import yfinance as yf  # noqa: WPS433
         ticker = yf.Ticker("^VIX")
-        hist = ticker.history(period="5d")
+        hist = ticker.history(period="5d", timeout=_http_timeout(deadline)[1])
         if hist is not None and not hist.empty:
             value = float(hist["Close"].dropna().iloc[-1])
             return round(value, 2), "yfinance-daily"
@@ -76,19 +244,13 @@ def _yf_daily() -> Optional[Tuple[float, str]]:
     return None
 
 
-def _yahoo_direct() -> Optional[Tuple[float, str]]:
+def _yahoo_direct(deadline: float) -> Optional[Tuple[float, str]]:
     """Yahoo Finance API with custom user agent to reduce rate limiting."""
-    import requests
     url = "https://query1.finance.yahoo.com/v7/finance/quote?symbols=%5EVIX"
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    resp = requests.get(url, headers=headers, timeout=10)
-    if resp.status_code != 200:
-        logger.debug("Yahoo direct status %d", resp.status_code)
-        return None
+    resp = _get_session().get(url, timeout=_http_timeout(deadline))
+    _check_status(resp.status_code, resp.headers.get("Retry-After"))
     try:
-        data = resp.json()
+        data = _loads(resp.content)
         result = data.get("quoteResponse", {}).get("result", [])
         if result:
             price = result[0].get("regularMarketPrice")
@@ -99,7 +261,25 @@ def _yahoo_direct() -> Optional[Tuple[float, str]]:
     return None
 
 
-def _cnbc_scrape() -> Optional[Tuple[float, str]]:
+def _yahoo_chart(deadline: float) -> Optional[Tuple[float, str]]:
+    """Yahoo Finance chart API: same 1m data as yfinance, without pandas."""
+    url = "https://query1.finance.yahoo.com/v8/finance/chart/%5EVIX?interval=1m&range=1d"
+    resp = _get_session().get(url, timeout=_http_timeout(deadline))
+    _check_status(resp.status_code, resp.headers.get("Retry-After"))
+    try:
+        data = _loads(resp.content)
+        result = (data.get("chart") or {}).get("result") or []
+        if result:
+            closes = result[0]["indicators"]["quote"][0].get("close") or []
+            for close in reversed(closes):
+                if close is not None and not math.isnan(close):
+                    return round(float(close), 2), "yahoo-chart"
+    except Exception as exc:  # pragma: no cover
+        logger.debug("Yahoo chart parse error: %s", exc)
+    return None
+
+
+def _cnbc_scrape(deadline: float) -> Optional[Tuple[float, str]]:
     """Scrape VIX from CNBC website."""
     import requests
     from bs4 import BeautifulSoup
@@ -108,7 +288,7 @@ def _cnbc_scrape() -> Optional[Tuple[float, str]]:
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
     }
     try:
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = requests.get(url, headers=headers, timeout=_http_timeout(deadline))
         if resp.status_code != 200:
             return None
         soup = BeautifulSoup(resp.text, 'lxml')
@@ -123,7 +303,7 @@ def _cnbc_scrape() -> Optional[Tuple[float, str]]:
     return None
 
 
-def _investing_scrape() -> Optional[Tuple[float, str]]:
+def _investing_scrape(deadline: float) -> Optional[Tuple[float, str]]:
     """Scrape VIX from Investing.com."""
     import requests
     from bs4 import BeautifulSoup
@@ -132,7 +312,7 @@ def _investing_scrape() -> Optional[Tuple[float, str]]:
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
     }
     try:
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = requests.get(url, headers=headers, timeout=_http_timeout(deadline))
         if resp.status_code != 200:
             return None
         soup = BeautifulSoup(resp.text, 'lxml')
@@ -151,14 +331,56 @@ def _investing_scrape() -> Optional[Tuple[float, str]]:
     return None
 
 
-def _cboe_api() -> Optional[Tuple[float, str]]:
-    import requests
-    url = "https://cdn.cboe.com/api/global/us_indices/quotes/VIX.json"
-    resp = requests.get(url, timeout=10)
-    if resp.status_code != 200:
-        return None
+CBOE_HOST = "cdn.cboe.com"
+CBOE_PATH = "/api/global/us_indices/quotes/VIX.json"
+
+# One keep-alive connection per thread, reused across the retries of
+# _cboe_api on that thread. Only the owning thread can close it, so race
+# workers drop theirs with _drop_cboe_connection() before exiting.
+_CBOE_LOCAL = threading.local()
+
+
+def _drop_cboe_connection() -> None:
+    """Close the calling thread's CBOE connection, if any."""
+    conn = getattr(_CBOE_LOCAL, "conn", None)
+    if conn is not None:
+        conn.close()
+        _CBOE_LOCAL.conn = None
+
+
+def _cboe_connection(deadline: float) -> http.client.HTTPSConnection:
+    """Return this thread's CBOE connection, (re)connecting with the connect timeout."""
+    connect_timeout, read_timeout = _http_timeout(deadline)
+    conn = getattr(_CBOE_LOCAL, "conn", None)
+    if conn is None:
+        conn = _CBOE_LOCAL.conn = http.client.HTTPSConnection(CBOE_HOST, timeout=connect_timeout)
+    if conn.sock is None:
+        conn.timeout = connect_timeout
+        conn.connect()
+    conn.sock.settimeout(read_timeout)
+    return conn
+
+
+def _cboe_api(deadline: float) -> Optional[Tuple[float, str]]:
+    """CBOE index quote over a plain keep-alive connection reused across retries.
+
+    Unlike requests, http.client does not follow redirects; a 3xx is
+    reported as an HTTP error.
+    """
+    try:
+        conn = _cboe_connection(deadline)
+        conn.request("GET", CBOE_PATH, headers={
+            'User-Agent': USER_AGENT,
+            'Accept': 'application/json',
+        })
+        resp = conn.getresponse()
+        body = resp.read()
+    except Exception:
+        _drop_cboe_connection()  # next attempt reconnects
+        raise
+    _check_status(resp.status, resp.getheader("Retry-After"))
     try:
-        data = resp.json()
+        data = _loads(body)
         entries = data.get("data") or []
         if entries:
             last_sale = entries[0].get("lastSale")
@@ -169,53 +391,161 @@ def _cboe_api() -> Optional[Tuple[float, str]]:
     return None
 
 
+def _read_cache() -> Optional[Tuple[float, str]]:
+    """Return the last good (value, "cached:<source>") if it is younger than the TTL."""
+    if CACHE_TTL_SECONDS <= 0:
+        return None
+    try:
+        with open(_CACHE_PATH, "r", encoding="utf-8") as fh:
+            cached = json.load(fh)
+        value = float(cached["vix"])
+        age = time.time() - float(cached["ts"])  # negative for future timestamps (clock skew, edited file)
+        if 0 <= age < CACHE_TTL_SECONDS and not math.isnan(value):
+            return value, f"cached:{cached['source']}"
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.debug("Cache read skipped: %s", exc)
+    return None
+
+
+def _write_cache(value: float, source: str) -> None:
+    """Atomically persist the last good value for subsequent runs."""
+    if CACHE_TTL_SECONDS <= 0 or math.isnan(value):
+        return
+    directory = _CACHE_PATH.parent
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".vix_cache.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump({"vix": value, "source": source, "ts": time.time()}, fh)
+            os.replace(tmp_path, _CACHE_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as exc:  # pragma: no cover
+        logger.debug("Cache write failed: %s", exc)
+
+
+# Cheap JSON providers raced concurrently; the first success wins.
+RACE_PROVIDERS: Tuple[Tuple[str, Fetcher], ...] = (
+    ("yahoo-chart", _yahoo_chart),
+    ("cboe", _cboe_api),
+    ("yahoo-direct", _yahoo_direct),
+)
+
+# Fallback tier, walked sequentially if every raced provider fails.
+# yfinance goes last: its import alone costs hundreds of milliseconds.
 FETCH_CHAIN: Tuple[Tuple[str, Fetcher], ...] = (
-    ("yfinance-intraday", _yf_intraday),
-    ("yfinance-daily", _yf_daily),
     ("cnbc-scrape", _cnbc_scrape),
     ("investing-scrape", _investing_scrape),
-    ("yahoo-direct", _yahoo_direct),
-    ("cboe", _cboe_api),
+) + ((
+    ("yfinance-daily", _yf_daily),
+) if ALLOW_YFINANCE else ())
+
+
+def _race(providers: Tuple[Tuple[str, Fetcher], ...], deadline: float) -> Optional[Tuple[float, str]]:
+    """Run providers concurrently and return the first non-None result.
+
+    Workers are daemon threads signalled through ``stop`` once a winner is
+    found or the race times out, so losers neither keep retrying nor keep
+    the interpreter alive at exit.
+    """
+    logger.info("Racing providers: %s", ", ".join(name for name, _ in providers))
+    timeout = max(0.0, min(RACE_TIMEOUT_SECONDS, deadline - time.monotonic()))
+    race_deadline = time.monotonic() + timeout
+    stop = threading.Event()
+    results: "queue.Queue[Optional[Tuple[float, str]]]" = queue.Queue()
+
+    def worker(fn: Fetcher, name: str) -> None:
+        result = None
+        try:
+            result = _retry(fn, name, deadline, stop)
+        finally:
+            try:
+                _drop_cboe_connection()  # only this thread can close its connection
+            finally:
+                results.put(result)
+
+    for name, fn in providers:
+        threading.Thread(target=worker, args=(fn, name), name=f"race-{name}", daemon=True).start()
+    try:
+        for _ in providers:
+            result = results.get(timeout=max(0.0, race_deadline - time.monotonic()))
+            if result is not None:
+                return result
+    except queue.Empty:
+        logger.warning("Provider race exceeded %.1fs budget", timeout)
+    finally:
+        stop.set()
+    return None
+
+
+# Prepared steps in priority order: the provider race, then each fallback
+# wrapped in its retry policy. Every step takes only the shared deadline.
+_CHAIN: Tuple[Fetcher, ...] = (functools.partial(_race, RACE_PROVIDERS),) + tuple(
+    functools.partial(_retry, fn, name) for name, fn in FETCH_CHAIN
 )
 
 
-def fetch_vix() -> Tuple[float, str]:
+def fetch_vix(deadline: Optional[float] = None) -> Tuple[float, str]:
     """Try multiple providers to obtain the VIX value.
+    Gives up once ``deadline`` (time.monotonic(); default now + BUDGET_SECONDS)
+    passes; each HTTP request's timeout is clamped to the time left.
     Returns (value, source) or raises RuntimeError if all fail.
     """
-    for name, fn in FETCH_CHAIN:
-        logger.info("Trying provider: %s", name)
-        result = _retry(fn, name)
-        if result is not None:
-            value, source = result
-            logger.info("Fetched VIX %.2f from %s", value, source)
-            return value, source
-    raise RuntimeError("All VIX data sources failed")
+    if deadline is None:
+        deadline = time.monotonic() + BUDGET_SECONDS
+    cached = _read_cache()
+    if cached is not None:
+        value, source = cached
+        logger.info("Using cached VIX %.2f from %s", value, source)
+        return value, source
+    result = next((r for r in (step(deadline) for step in _CHAIN) if r is not None), None)
+    if result is None:
+        raise RuntimeError("All VIX data sources failed")
+    value, source = result
+    logger.info("Fetched VIX %.2f from %s", value, source)
+    _write_cache(value, source)
+    return value, source
+
+
+_UTC = timezone.utc
+# Fixes key order and the constant threshold; build_payload fills in the rest.
+_PAYLOAD_TEMPLATE: Dict[str, Any] = {
+    "timestamp": None,
+    "vix": None,
+    "threshold": THRESHOLD,
+    "exceeded": False,
+    "source": None,
+}
 
 
 def build_payload(vix_value: float, source: str) -> Dict[str, Any]:
-    exceeded = vix_value >= THRESHOLD
     return {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        **_PAYLOAD_TEMPLATE,
+        "timestamp": datetime.now(_UTC).isoformat(timespec="seconds"),
         "vix": vix_value,
-        "threshold": THRESHOLD,
-        "exceeded": exceeded,
+        "exceeded": vix_value >= THRESHOLD,
         "source": source,
     }
 
 
-def emit_github_outputs(payload: Dict[str, Any]) -> None:
+def emit_github_outputs(payload: Dict[str, Any], payload_json: Optional[str] = None) -> None:
+    """Append outputs to $GITHUB_OUTPUT; ``payload_json`` skips re-encoding."""
     github_output = os.getenv("GITHUB_OUTPUT")
     if not github_output:
         return
+    blob = (
+        f"vix_value={payload['vix']}\n"
+        f"vix_exceeded={'true' if payload['exceeded'] else 'false'}\n"
+        f"vix_source={payload['source']}\n"
+        "vix_payload<<EOF\n"
+        f"{payload_json if payload_json is not None else _dumps(payload)}\n"
+        "EOF\n"
+    )
     try:
-        with open(github_output, "a", encoding="utf-8") as fh:
-            fh.write(f"vix_value={payload['vix']}\n")
-            fh.write(f"vix_exceeded={'true' if payload['exceeded'] else 'false'}\n")
-            fh.write(f"vix_source={payload['source']}\n")
-            fh.write("vix_payload<<EOF\n")
-            fh.write(json.dumps(payload) + "\n")
-            fh.write("EOF\n")
+        # One buffered append; no fsync, the runner reads the file after the step.
+        with open(github_output, "a", encoding="utf-8", buffering=65536) as fh:
+            fh.write(blob)
     except OSError as exc:  # pragma: no cover
         logger.error("Failed to write GitHub output: %s", exc)
 
@@ -226,13 +556,19 @@ def main() -> int:
     except Exception as exc:
         logger.error("Error fetching VIX: %s", exc)
         payload = build_payload(float('nan'), "error")
+        payload["vix"] = None  # NaN is not valid JSON; emit null with either encoder
         payload["error"] = str(exc)
-        print(json.dumps(payload))
+        print(_dumps(payload))
+        _LOG_HANDLER.flush()
         return 2
+    finally:
+        _close_connections()
 
     payload = build_payload(vix_value, source)
-    print(json.dumps(payload))
-    emit_github_outputs(payload)
+    payload_json = _dumps(payload)
+    print(payload_json)
+    emit_github_outputs(payload, payload_json)
+    _LOG_HANDLER.flush()
     return 0
 
 